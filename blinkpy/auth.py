@@ -1,5 +1,7 @@
 """Login handler for blink."""
+import os.path
 import logging
+import threading
 from functools import partial
 from requests import Request, Session, exceptions
 from requests.adapters import HTTPAdapter
@@ -8,6 +10,7 @@ from blinkpy import api
 from blinkpy.helpers import util
 from blinkpy.helpers.constants import (
     BLINK_URL,
+    DEFAULT_POOL_SIZE,
     DEFAULT_USER_AGENT,
     LOGIN_ENDPOINT,
     TIMEOUT,
@@ -19,7 +22,7 @@ _LOGGER = logging.getLogger(__name__)
 class Auth:
     """Class to handle login communication."""
 
-    def __init__(self, login_data=None, no_prompt=False):
+    def __init__(self, login_data=None, no_prompt=False, login_file=None):
         """
         Initialize auth handler.
 
@@ -29,7 +32,14 @@ class Auth:
                              - password
         :param no_prompt: Should any user input prompts
                           be supressed? True/FALSE
+        :param login_file: json file to keep login data in.  Loaded when
+                           login_data is not given and re-saved after each
+                           verified token refresh so later sessions can
+                           skip login.
         """
+        if login_data is None and login_file is not None:
+            if os.path.isfile(login_file):
+                login_data = util.json_load(login_file)
         if login_data is None:
             login_data = {}
         self.data = login_data
@@ -41,6 +51,8 @@ class Auth:
         self.login_response = None
         self.is_errored = False
         self.no_prompt = no_prompt
+        self.login_file = login_file
+        self._refresh_lock = threading.RLock()
         self.session = self.create_session()
 
     @property
@@ -71,6 +83,8 @@ class Auth:
         backoff = opts.get("backoff", 1)
         retries = opts.get("retries", 3)
         retry_list = opts.get("retry_list", [429, 500, 502, 503, 504])
+        pool_connections = opts.get("pool_connections", 10)
+        pool_maxsize = opts.get("pool_maxsize", DEFAULT_POOL_SIZE)
         sess = Session()
         assert_status_hook = [
             lambda response, *args, **kwargs: response.raise_for_status()
@@ -79,7 +93,11 @@ class Auth:
         retry = Retry(
             total=retries, backoff_factor=backoff, status_forcelist=retry_list
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
         sess.mount("https://", adapter)
         sess.mount("http://", adapter)
         sess.get = partial(sess.get, timeout=TIMEOUT)
@@ -111,7 +129,7 @@ class Auth:
         )
         try:
             if response.status_code == 200:
-                return response.json()
+                return util.json_response(response)
             raise LoginError
         except AttributeError as error:
             raise LoginError from error
@@ -122,19 +140,39 @@ class Auth:
 
     def refresh_token(self):
         """Refresh auth token."""
-        self.is_errored = True
+        with self._refresh_lock:
+            self.is_errored = True
+            try:
+                _LOGGER.info("Token expired, attempting automatic refresh.")
+                self.login_response = self.login()
+                self.extract_login_info()
+                self.is_errored = False
+                if not self.check_key_required():
+                    self.save_login_file()
+            except LoginError as error:
+                _LOGGER.error("Login endpoint failed. Try again later.")
+                raise TokenRefreshFailed from error
+            except (TypeError, KeyError) as error:
+                _LOGGER.error("Malformed login response: %s", self.login_response)
+                raise TokenRefreshFailed from error
+            return True
+
+    def save_login_file(self):
+        """Save login data to login_file, if one was given."""
+        if self.login_file is None:
+            return
         try:
-            _LOGGER.info("Token expired, attempting automatic refresh.")
-            self.login_response = self.login()
-            self.extract_login_info()
-            self.is_errored = False
-        except LoginError as error:
-            _LOGGER.error("Login endpoint failed. Try again later.")
-            raise TokenRefreshFailed from error
-        except (TypeError, KeyError) as error:
-            _LOGGER.error("Malformed login response: %s", self.login_response)
-            raise TokenRefreshFailed from error
-        return True
+            util.json_save(self.login_attributes, self.login_file)
+        except OSError as error:
+            _LOGGER.error("Unable to save login data to %s: %s", self.login_file, error)
+
+    def refresh_expired_token(self, expired_token):
+        """Refresh the token unless another request already replaced it."""
+        with self._refresh_lock:
+            if self.token != expired_token:
+                _LOGGER.debug("Token was already refreshed by another request.")
+                return True
+            return self.refresh_token()
 
     def extract_login_info(self):
         """Extract login info from login response."""
@@ -161,7 +199,7 @@ class Auth:
                 raise UnauthorizedError
             if response.status_code == 404:
                 raise exceptions.ConnectionError
-            json_data = response.json()
+            json_data = util.json_response(response)
         except KeyError:
             pass
         except (AttributeError, ValueError) as error:
@@ -193,6 +231,7 @@ class Auth:
         :param is_retry: Is this part of a re-auth attempt? True/FALSE
         """
         req = self.prepare_request(url, headers, data, reqtype)
+        token = self.token
         try:
             response = self.session.send(req, stream=stream, timeout=timeout)
             return self.validate_response(response, json_resp)
@@ -218,7 +257,7 @@ class Auth:
         except UnauthorizedError:
             try:
                 if not is_retry:
-                    self.refresh_token()
+                    self.refresh_expired_token(token)
                     return self.query(
                         url=url,
                         data=data,
@@ -239,7 +278,7 @@ class Auth:
         if key is not None:
             response = api.request_verify(self, blink, key)
             try:
-                json_resp = response.json()
+                json_resp = util.json_response(response)
                 blink.available = json_resp["valid"]
                 if not json_resp["valid"]:
                     _LOGGER.error("%s", json_resp["message"])
@@ -247,6 +286,7 @@ class Auth:
             except (KeyError, TypeError):
                 _LOGGER.error("Did not receive valid response from server.")
                 return False
+            self.save_login_file()
         return True
 
     def check_key_required(self):
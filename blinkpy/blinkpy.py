@@ -14,21 +14,29 @@ blinkpy is in no way affiliated with Blink, nor Immedia Inc.
 """
 
 import os.path
+import json
 import time
 import logging
+import threading
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from shutil import copyfileobj
 
 from requests.structures import CaseInsensitiveDict
-from dateutil.parser import parse
 from slugify import slugify
 
 from blinkpy import api
 from blinkpy.sync_module import BlinkSyncModule, BlinkOwl, BlinkLotus
 from blinkpy.helpers import util
 from blinkpy.helpers.constants import (
+    DEFAULT_DOWNLOAD_WORKERS,
     DEFAULT_MOTION_INTERVAL,
     DEFAULT_REFRESH,
+    DOWNLOAD_MANIFEST,
+    MAX_REFRESH_WORKERS,
     MIN_THROTTLE_TIME,
+    SIZE_MEDIA_CHUNK,
     TIMEOUT_MEDIA,
 )
 from blinkpy.helpers.constants import __version__
@@ -64,16 +72,48 @@ class Blink:
         self.urls = None
         self.sync = CaseInsensitiveDict({})
         self.last_refresh = None
+        self._last_refresh_mono = None
         self.refresh_rate = refresh_rate
         self.networks = []
-        self.cameras = CaseInsensitiveDict({})
-        self.video_list = CaseInsensitiveDict({})
+        self._cameras = CaseInsensitiveDict({})
+        self.video_list = {}
         self.motion_interval = motion_interval
         self.version = __version__
         self.available = False
         self.key_required = False
         self.homescreen = {}
         self.no_owls = no_owls
+        self._downloaded_keys = set()
+        self._manifest_file = None
+        self._manifest_lock = threading.Lock()
+        self._refresh_pool = None
+
+    def __del__(self):
+        """Shut down refresh worker threads."""
+        refresh_pool = getattr(self, "_refresh_pool", None)
+        if refresh_pool is not None:
+            refresh_pool.shutdown(wait=False)
+
+    @property
+    def cameras(self):
+        """Return a combined view of the cameras in all sync modules."""
+        return _CameraView(
+            self._cameras, *[sync_module.cameras for sync_module in self.sync.values()]
+        )
+
+    @cameras.setter
+    def cameras(self, value):
+        """Set cameras that are not part of any sync module."""
+        self._cameras = CaseInsensitiveDict(value)
+
+    @property
+    def refresh_pool(self):
+        """Return the thread pool used to refresh sync modules."""
+        if self._refresh_pool is None:
+            self._refresh_pool = ThreadPoolExecutor(
+                max_workers=min(MAX_REFRESH_WORKERS, len(self.sync) or 1)
+            )
+        return self._refresh_pool
 
     @util.Throttle(seconds=MIN_THROTTLE_TIME)
     def refresh(self, force=False, force_cache=False):
@@ -88,12 +128,20 @@ class Blink:
                 self.setup_post_verify()
 
             self.get_homescreen()
+            refreshes = []
             for sync_name, sync_module in self.sync.items():
                 _LOGGER.debug("Attempting refresh of sync %s", sync_name)
-                sync_module.refresh(force_cache=(force or force_cache))
+                refreshes.append(
+                    self.refresh_pool.submit(
+                        sync_module.refresh, force_cache=(force or force_cache)
+                    )
+                )
+            for sync_refresh in refreshes:
+                sync_refresh.result()
             if not force_cache:
                 # Prevents rapid clearing of motion detect property
                 self.last_refresh = int(time.time())
+                self._last_refresh_mono = time.monotonic()
             return True
         return False
 
@@ -137,8 +185,6 @@ class Blink:
             sync_cameras = cameras.get(network_id, {})
             self.setup_sync_module(name, network_id, sync_cameras)
 
-        self.cameras = self.merge_cameras()
-
         self.available = True
         self.key_required = False
         return True
@@ -160,11 +206,12 @@ class Blink:
         """Check for mini cameras."""
         network_list = []
         camera_list = []
+        known_networks = set(self.network_ids)
         try:
             for owl in self.homescreen["owls"]:
                 name = owl["name"]
                 network_id = str(owl["network_id"])
-                if network_id in self.network_ids:
+                if network_id in known_networks:
                     camera_list.append(
                         {network_id: {"name": name, "id": network_id, "type": "mini"}}
                     )
@@ -184,11 +231,12 @@ class Blink:
         """Check for doorbells cameras."""
         network_list = []
         camera_list = []
+        known_networks = set(self.network_ids)
         try:
             for lotus in self.homescreen["doorbells"]:
                 name = lotus["name"]
                 network_id = str(lotus["network_id"])
-                if network_id in self.network_ids:
+                if network_id in known_networks:
                     camera_list.append(
                         {
                             network_id: {
@@ -244,7 +292,7 @@ class Blink:
     def setup_urls(self):
         """Create urls for api."""
         try:
-            self.urls = util.BlinkURLHandler(self.auth.region_id)
+            self.urls = util.get_url_handler(self.auth.region_id)
         except TypeError:
             _LOGGER.error(
                 "Unable to extract region is from response %s", self.auth.login_response
@@ -279,27 +327,30 @@ class Blink:
 
     def check_if_ok_to_update(self):
         """Check if it is ok to perform an http request."""
-        current_time = int(time.time())
-        last_refresh = self.last_refresh
-        if last_refresh is None:
-            last_refresh = 0
-        if current_time >= (last_refresh + self.refresh_rate):
+        if self._last_refresh_mono is None:
             return True
-        return False
+        return time.monotonic() - self._last_refresh_mono >= self.refresh_rate
 
     def merge_cameras(self):
         """Merge all sync camera dicts into one."""
-        combined = CaseInsensitiveDict({})
-        for sync in self.sync:
-            combined = util.merge_dicts(combined, self.sync[sync].cameras)
-        return combined
+        combined = {}
+        for sync_module in self.sync.values():
+            combined.update(sync_module.cameras)
+        return CaseInsensitiveDict(combined)
 
     def save(self, file_name):
         """Save login data to file."""
         util.json_save(self.auth.login_attributes, file_name)
 
     def download_videos(
-        self, path, since=None, camera="all", stop=10, delay=1, debug=False
+        self,
+        path,
+        since=None,
+        camera="all",
+        stop=10,
+        delay=1,
+        debug=False,
+        max_workers=DEFAULT_DOWNLOAD_WORKERS,
     ):
         """
         Download all videos from server since specified time.
@@ -311,37 +362,62 @@ class Blink:
         :param camera: Camera name to retrieve.  Defaults to "all".
                        Use a list for multiple cameras.
         :param stop: Page to stop on (~25 items per page. Default page 10).
-        :param delay: Number of seconds to wait in between subsequent video downloads.
+        :param delay: Number of seconds each download worker waits after a
+                      video before starting its next one.  With max_workers
+                      set to 1, downloads run one at a time with this gap.
         :param debug: Set to TRUE to prevent downloading of items.
                       Instead of downloading, entries will be printed to log.
+        :param max_workers: Maximum number of videos to download concurrently.
+
+        Downloaded videos are recorded in a manifest file within path and are
+        skipped on later calls without checking for the file on disk.  A video
+        deleted from path is therefore not downloaded again; remove its entry
+        from the manifest (or the manifest itself) to fetch it once more.
         """
         if since is None:
             since_epochs = self.last_refresh
         else:
-            parsed_datetime = parse(since, fuzzy=True)
-            since_epochs = parsed_datetime.timestamp()
+            since_epochs = _parse_since(since).timestamp()
 
         formatted_date = util.get_time(time_to_convert=since_epochs)
         _LOGGER.info("Retrieving videos since %s", formatted_date)
 
         if not isinstance(camera, list):
             camera = [camera]
+        wanted = frozenset(camera)
+        all_requested = "all" in wanted
+
+        self._manifest_file = os.path.join(path, DOWNLOAD_MANIFEST)
+        self._downloaded_keys = self._load_manifest()
+
+        downloads = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for page in range(1, stop):
+                response = api.request_videos(self, time=since_epochs, page=page)
+                _LOGGER.debug("Processing page %s", page)
+                try:
+                    result = response["media"]
+                    if not result:
+                        raise KeyError
+                except (KeyError, TypeError):
+                    _LOGGER.info("No videos found on page %s. Exiting.", page)
+                    break
+
+                downloads.extend(
+                    self._parse_downloaded_items(
+                        result, wanted, all_requested, path, delay, debug, executor
+                    )
+                )
 
-        for page in range(1, stop):
-            response = api.request_videos(self, time=since_epochs, page=page)
-            _LOGGER.debug("Processing page %s", page)
-            try:
-                result = response["media"]
-                if not result:
-                    raise KeyError
-            except (KeyError, TypeError):
-                _LOGGER.info("No videos found on page %s. Exiting.", page)
-                break
-
-            self._parse_downloaded_items(result, camera, path, delay, debug)
+        for download in downloads:
+            download.result()
 
-    def _parse_downloaded_items(self, result, camera, path, delay, debug):
-        """Parse downloaded videos."""
+    def _parse_downloaded_items(
+        self, result, wanted, all_requested, path, delay, debug, executor
+    ):
+        """Parse downloaded videos and queue them for download."""
+        base_url = self.urls.base_url
+        downloads = []
         for item in result:
             try:
                 created_at = item["created_at"]
@@ -352,7 +428,7 @@ class Blink:
                 _LOGGER.info("Missing clip information, skipping...")
                 continue
 
-            if camera_name not in camera and "all" not in camera:
+            if not all_requested and camera_name not in wanted:
                 _LOGGER.debug("Skipping videos for %s.", camera_name)
                 continue
 
@@ -360,27 +436,21 @@ class Blink:
                 _LOGGER.debug("%s: %s is marked as deleted.", camera_name, address)
                 continue
 
-            clip_address = f"{self.urls.base_url}{address}"
-            filename = f"{camera_name}-{created_at}"
-            filename = f"{slugify(filename)}.mp4"
-            filename = os.path.join(path, filename)
+            clip_address = f"{base_url}{address}"
+            filename = slugify(f"{camera_name}-{created_at}")
+            filename = os.path.join(path, f"{filename}.mp4")
 
             if not debug:
-                if os.path.isfile(filename):
+                key = self._manifest_key(camera_name, created_at)
+                if key in self._downloaded_keys or os.path.isfile(filename):
                     _LOGGER.info("%s already exists, skipping...", filename)
                     continue
 
-                response = api.http_get(
-                    self,
-                    url=clip_address,
-                    stream=True,
-                    json=False,
-                    timeout=TIMEOUT_MEDIA,
+                downloads.append(
+                    executor.submit(
+                        self._download_one, clip_address, filename, key, delay
+                    )
                 )
-                with open(filename, "wb") as vidfile:
-                    copyfileobj(response.raw, vidfile)
-
-                _LOGGER.info("Downloaded video to %s", filename)
             else:
                 print(
                     (
@@ -388,9 +458,122 @@ class Blink:
                         f"Address: {address}, Filename: {filename}"
                     )
                 )
+                if delay > 0:
+                    time.sleep(delay)
+        return downloads
+
+    def _download_one(self, clip_address, filename, key, delay=0):
+        """Download a single video clip to file, then wait delay seconds."""
+        try:
+            return self._write_clip(clip_address, filename, key)
+        finally:
             if delay > 0:
                 time.sleep(delay)
 
+    def _write_clip(self, clip_address, filename, key):
+        """Write a video clip to file and record it in the manifest."""
+        response = api.http_get(
+            self,
+            url=clip_address,
+            stream=True,
+            json=False,
+            timeout=TIMEOUT_MEDIA,
+        )
+        if response is None:
+            _LOGGER.error("Unable to download video from %s", clip_address)
+            return False
+
+        # Media is always served over TLS and decrypted in userspace, so a
+        # zero-copy os.sendfile/splice from the socket is not possible here.
+        response.raw.decode_content = True
+        with open(filename, "wb") as vidfile:
+            copyfileobj(response.raw, vidfile, SIZE_MEDIA_CHUNK)
+
+        self._record_download(key)
+        _LOGGER.info("Downloaded video to %s", filename)
+        return True
+
+    @staticmethod
+    def _manifest_key(camera_name, created_at):
+        """Return the download manifest key of a video."""
+        return f"{camera_name}|{created_at}"
+
+    def _load_manifest(self):
+        """Load keys of previously downloaded videos."""
+        keys = set()
+        try:
+            with open(self._manifest_file, "r") as manifest:
+                for line in manifest:
+                    try:
+                        keys.add(json.loads(line))
+                    except ValueError:
+                        # Partial line left by an interrupted write.
+                        continue
+        except FileNotFoundError:
+            pass
+        return keys
+
+    def _record_download(self, key):
+        """Add a downloaded video to the manifest."""
+        with self._manifest_lock:
+            self._downloaded_keys.add(key)
+            with open(self._manifest_file, "a") as manifest:
+                manifest.write(f"{json.dumps(key)}\n")
+
+
+def _parse_since(since):
+    """Parse a date and time string, trying the fastest parser first."""
+    from dateutil.parser import parse
+
+    try:
+        return datetime.fromisoformat(since)
+    except ValueError:
+        pass
+    try:
+        return parse(since)
+    except (ValueError, OverflowError):
+        return parse(since, fuzzy=True)
+
+
+class _CameraView(ChainMap):
+    """ChainMap of camera dicts with case-insensitive names."""
+
+    def __iter__(self):
+        """Iterate camera names once each, ignoring case."""
+        names = {}
+        for mapping in reversed(self.maps):
+            for name in mapping:
+                names[name.lower()] = name
+        return iter(names.values())
+
+    def __len__(self):
+        """Return the number of distinct camera names."""
+        return sum(1 for _ in self)
+
+    def __delitem__(self, key):
+        """Remove a camera from the dict that provides it."""
+        for mapping in self.maps:
+            if key in mapping:
+                del mapping[key]
+                return
+        raise KeyError(key)
+
+    def pop(self, key, *default):
+        """Remove a camera from the dict that provides it and return it."""
+        for mapping in self.maps:
+            if key in mapping:
+                return mapping.pop(key)
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self):
+        """Remove and return a camera from the dict that provides it."""
+        for mapping in self.maps:
+            if mapping:
+                return mapping.popitem()
+        raise KeyError("No cameras found.")
+
 
 class BlinkSetupError(Exception):
     """Class to handle setup errors."""
@@ -5,7 +5,7 @@ import logging
 from json import dumps
 from requests.compat import urljoin
 from blinkpy import api
-from blinkpy.helpers.constants import TIMEOUT_MEDIA
+from blinkpy.helpers.constants import SIZE_MEDIA_CHUNK, TIMEOUT_MEDIA
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -256,8 +256,9 @@ class BlinkCamera:
         if response is None:
             _LOGGER.error("No saved video exist for %s.", self.name)
             return
+        response.raw.decode_content = True
         with open(path, "wb") as vidfile:
-            copyfileobj(response.raw, vidfile)
+            copyfileobj(response.raw, vidfile, SIZE_MEDIA_CHUNK)
 
 
 class BlinkCameraMini(BlinkCamera):
@@ -63,9 +63,14 @@ DEFAULT_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_13_6) AppleWebKi
 DEVICE_ID = "Blinkpy"
 TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 DEFAULT_MOTION_INTERVAL = 1
+DEFAULT_DOWNLOAD_WORKERS = 8
+DEFAULT_POOL_SIZE = 16
+MAX_REFRESH_WORKERS = 8
 DEFAULT_REFRESH = 30
 MIN_THROTTLE_TIME = 2
 SIZE_NOTIFICATION_KEY = 152
 SIZE_UID = 16
+SIZE_MEDIA_CHUNK = 1024 * 1024
 TIMEOUT = 10
 TIMEOUT_MEDIA = 90
+DOWNLOAD_MANIFEST = ".blinkpy_manifest.json"
@@ -1,15 +1,21 @@
 """Useful functions for blinkpy."""
 
+import os
 import json
 import logging
 import time
 import secrets
+import tempfile
 from calendar import timegm
-from functools import wraps
-from getpass import getpass
-import dateutil.parser
+from datetime import datetime
+from functools import lru_cache, wraps
 from blinkpy.helpers import constants as const
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,8 +35,24 @@ def json_load(file_name):
 
 def json_save(data, file_name):
     """Save data to file location."""
-    with open(file_name, "w") as json_file:
-        json.dump(data, json_file, indent=4)
+    file_dir = os.path.dirname(os.path.abspath(file_name))
+    with tempfile.NamedTemporaryFile(
+        "w", dir=file_dir, suffix=".tmp", delete=False
+    ) as json_file:
+        try:
+            json.dump(data, json_file, indent=4)
+        except BaseException:
+            json_file.close()
+            os.remove(json_file.name)
+            raise
+    os.replace(json_file.name, file_name)
+
+
+def json_response(response):
+    """Decode a json response body, using orjson if it is installed."""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
 
 
 def gen_uid(size, uid_format=False):
@@ -45,10 +67,16 @@ def gen_uid(size, uid_format=False):
 def time_to_seconds(timestamp):
     """Convert TIMESTAMP_FORMAT time to seconds."""
     try:
-        dtime = dateutil.parser.isoparse(timestamp)
-    except ValueError:
-        _LOGGER.error("Incorrect timestamp format for conversion: %s.", timestamp)
-        return False
+        dtime = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        # Fall back for ISO 8601 variants fromisoformat rejects, such as "Z".
+        import dateutil.parser
+
+        try:
+            dtime = dateutil.parser.isoparse(timestamp)
+        except ValueError:
+            _LOGGER.error("Incorrect timestamp format for conversion: %s.", timestamp)
+            return False
     return timegm(dtime.timetuple())
 
 
@@ -72,6 +100,8 @@ def merge_dicts(dict_a, dict_b):
 
 def prompt_login_data(data):
     """Prompt user for username and password."""
+    from getpass import getpass
+
     if data["username"] is None:
         data["username"] = input("Username:")
     if data["password"] is None:
@@ -119,6 +149,12 @@ class BlinkURLHandler:
         _LOGGER.debug("Setting base url to %s.", self.base_url)
 
 
+@lru_cache(maxsize=16)
+def get_url_handler(region_id):
+    """Return a shared BlinkURLHandler for a region."""
+    return BlinkURLHandler(region_id)
+
+
 class Throttle:
     """Class for throttling api calls."""
 
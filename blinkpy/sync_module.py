@@ -136,11 +136,12 @@ class BlinkSyncModule:
                 unique_info = self.get_unique_info(name)
                 if blink_camera_type in type_map.keys():
                     camera_type = type_map[blink_camera_type]
-                self.cameras[name] = camera_type(self)
+                camera = camera_type(self)
+                self.cameras[name] = camera
                 camera_info = self.get_camera_info(
                     camera_config["id"], unique_info=unique_info
                 )
-                self.cameras[name].update(camera_info, force_cache=True, force=True)
+                camera.update(camera_info, force_cache=True, force=True)
 
         except KeyError:
             _LOGGER.error("Could not create camera instances for %s", self.name)
@@ -197,13 +198,12 @@ class BlinkSyncModule:
         if not self.get_network_info():
             return
         self.check_new_videos()
-        for camera_name in self.cameras.keys():
-            camera_id = self.cameras[camera_name].camera_id
+        for camera_name, camera in self.cameras.items():
             camera_info = self.get_camera_info(
-                camera_id,
+                camera.camera_id,
                 unique_info=self.get_unique_info(camera_name),
             )
-            self.cameras[camera_name].update(camera_info, force_cache=force_cache)
+            camera.update(camera_info, force_cache=force_cache)
         self.available = True
 
     def check_new_videos(self):
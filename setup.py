@@ -22,7 +22,7 @@ with open(f"{THIS_DIR}/requirements.txt") as req_file:
 
 PACKAGES = find_packages(exclude=["tests*", "docs"])
 
-with open("{}/README.rst".format(THIS_DIR), encoding="utf-8") as readme_file:
+with open(f"{THIS_DIR}/README.rst", encoding="utf-8") as readme_file:
     LONG_DESCRIPTION = readme_file.read()
 
 setup(
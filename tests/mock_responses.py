@@ -1,5 +1,7 @@
 """Simple mock responses definitions."""
 
+import json
+
 
 class MockResponse:
     """Class for mock request response."""
@@ -15,6 +17,11 @@ class MockResponse:
         """Return json data from get_request."""
         return self.json_data
 
+    @property
+    def content(self):
+        """Return encoded json data from get_request."""
+        return json.dumps(self.json_data).encode()
+
     @property
     def raw(self):
         """Return raw data from get request."""
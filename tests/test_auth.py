@@ -1,5 +1,9 @@
 """Test login handler."""
 
+import os
+import tempfile
+import threading
+import time
 import unittest
 from unittest import mock
 from requests import exceptions
@@ -29,7 +33,7 @@ class TestAuth(unittest.TestCase):
         self.auth = None
 
     @mock.patch("blinkpy.helpers.util.gen_uid")
-    @mock.patch("blinkpy.auth.util.getpass")
+    @mock.patch("getpass.getpass")
     def test_empty_init(self, getpwd, genuid):
         """Test initialization with no params."""
         auth = Auth()
@@ -47,7 +51,7 @@ class TestAuth(unittest.TestCase):
         self.assertDictEqual(auth.data, expected_data)
 
     @mock.patch("blinkpy.helpers.util.gen_uid")
-    @mock.patch("blinkpy.auth.util.getpass")
+    @mock.patch("getpass.getpass")
     def test_barebones_init(self, getpwd, genuid):
         """Test basebones initialization."""
         login_data = {"username": "foo", "password": "bar"}
@@ -172,6 +176,72 @@ class TestAuth(unittest.TestCase):
         self.assertEqual(self.auth.client_id, 1234)
         self.assertEqual(self.auth.account_id, 5678)
 
+    @mock.patch("blinkpy.auth.Auth.login")
+    def test_refresh_token_login_file(self, mock_login):
+        """Test that a refreshed token is saved to and loaded from file."""
+        mock_login.return_value = {
+            "account": {"account_id": 5678, "client_id": 1234, "tier": "test"},
+            "auth": {"token": "foobar"},
+        }
+        with tempfile.TemporaryDirectory() as path:
+            login_file = os.path.join(path, "login.json")
+            auth = Auth({"username": USERNAME}, login_file=login_file)
+            self.assertTrue(auth.refresh_token())
+            self.assertTrue(os.path.isfile(login_file))
+            self.assertEqual(os.listdir(path), ["login.json"])
+
+            restored = Auth(login_file=login_file)
+            self.assertEqual(restored.token, "foobar")
+            self.assertEqual(restored.region_id, "test")
+            self.assertEqual(restored.data["username"], USERNAME)
+
+    @mock.patch("blinkpy.auth.api.request_verify")
+    @mock.patch("blinkpy.auth.Auth.login")
+    def test_refresh_token_login_file_2fa(self, mock_login, mock_verify):
+        """Test that an unverified token is only saved after verification."""
+        mock_login.return_value = {
+            "account": {
+                "account_id": 5678,
+                "client_id": 1234,
+                "tier": "test",
+                "client_verification_required": True,
+            },
+            "auth": {"token": "foobar"},
+        }
+        mock_blink = MockBlink(None)
+        with tempfile.TemporaryDirectory() as path:
+            login_file = os.path.join(path, "login.json")
+            auth = Auth({"username": USERNAME}, login_file=login_file)
+            self.assertTrue(auth.refresh_token())
+            self.assertTrue(auth.check_key_required())
+            self.assertFalse(os.path.isfile(login_file))
+
+            mock_verify.return_value = mresp.MockResponse(
+                {"valid": False, "message": "bad pin"}, 200
+            )
+            with self.assertLogs(level="ERROR"):
+                self.assertFalse(auth.send_auth_key(mock_blink, 1234))
+            self.assertFalse(os.path.isfile(login_file))
+
+            mock_verify.return_value = mresp.MockResponse({"valid": True}, 200)
+            self.assertTrue(auth.send_auth_key(mock_blink, 1234))
+            self.assertEqual(Auth(login_file=login_file).token, "foobar")
+
+    @mock.patch("blinkpy.auth.util.json_save")
+    @mock.patch("blinkpy.auth.Auth.login")
+    def test_refresh_token_login_file_error(self, mock_login, mock_save):
+        """Test that a failed login file save does not fail the refresh."""
+        mock_login.return_value = {
+            "account": {"account_id": 5678, "client_id": 1234, "tier": "test"},
+            "auth": {"token": "foobar"},
+        }
+        mock_save.side_effect = OSError("read-only")
+        self.auth.login_file = "login.json"
+        with self.assertLogs(level="ERROR"):
+            self.assertTrue(self.auth.refresh_token())
+        self.assertEqual(self.auth.token, "foobar")
+        self.assertFalse(self.auth.is_errored)
+
     @mock.patch("blinkpy.auth.Auth.login")
     def test_refresh_token_failed(self, mock_login):
         """Test refresh token failed."""
@@ -245,6 +315,46 @@ class TestAuth(unittest.TestCase):
         mock_validate.side_effect = [UnauthorizedError, TokenRefreshFailed]
         self.assertEqual(self.auth.query(url="http://example.com"), None)
 
+    @mock.patch("blinkpy.auth.Auth.refresh_token")
+    def test_refresh_expired_token_already_refreshed(self, mock_refresh):
+        """Check that a token replaced by another request is not refreshed."""
+        self.auth.token = "new"
+        self.assertTrue(self.auth.refresh_expired_token("old"))
+        mock_refresh.assert_not_called()
+        self.assertTrue(self.auth.refresh_expired_token("new"))
+        mock_refresh.assert_called_once()
+
+    @mock.patch("blinkpy.auth.Auth.login")
+    def test_query_concurrent_token_refresh(self, mock_login):
+        """Check that concurrent unauthorized requests log in only once."""
+
+        def login():
+            time.sleep(0.05)
+            return {
+                "account": {"account_id": 5678, "client_id": 1234, "tier": "test"},
+                "auth": {"token": "new"},
+            }
+
+        mock_login.side_effect = login
+        self.auth.token = "old"
+        self.auth.session = ThreadedSession(threads=4)
+        results = []
+
+        def query():
+            results.append(
+                self.auth.query(url="http://example.com", headers=self.auth.header)
+            )
+
+        threads = [threading.Thread(target=query) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mock_login.assert_called_once()
+        self.assertEqual(self.auth.token, "new")
+        self.assertEqual(results, [{"foo": "bar"}] * 4)
+
     def test_default_session(self):
         """Test default session creation."""
         sess = self.auth.create_session()
@@ -254,15 +364,23 @@ class TestAuth(unittest.TestCase):
         self.assertEqual(
             adapter.max_retries.status_forcelist, [429, 500, 502, 503, 504]
         )
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 16)
 
     def test_custom_session_full(self):
         """Test full custom session creation."""
-        opts = {"backoff": 2, "retries": 10, "retry_list": [404]}
+        opts = {
+            "backoff": 2,
+            "retries": 10,
+            "retry_list": [404],
+            "pool_connections": 4,
+            "pool_maxsize": 32,
+        }
         sess = self.auth.create_session(opts=opts)
         adapter = sess.adapters["https://"]
         self.assertEqual(adapter.max_retries.total, 10)
         self.assertEqual(adapter.max_retries.backoff_factor, 2)
         self.assertEqual(adapter.max_retries.status_forcelist, [404])
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 32)
 
     def test_custom_session_partial(self):
         """Test partial custom session creation."""
@@ -297,6 +415,21 @@ class MockSession:
         return None
 
 
+class ThreadedSession:
+    """Object to mock a session shared by several threads."""
+
+    def __init__(self, threads):
+        """Initialize mock session."""
+        self.barrier = threading.Barrier(threads)
+
+    def send(self, req, *args, **kwargs):
+        """Reject the old token once every thread has sent a request."""
+        if req.headers["TOKEN_AUTH"] == "old":
+            self.barrier.wait(timeout=5)
+            return mresp.MockResponse({}, 401)
+        return mresp.MockResponse({"foo": "bar"}, 200)
+
+
 class MockBlink:
     """Object to mock basic blink class."""
 
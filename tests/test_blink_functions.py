@@ -1,4 +1,8 @@
 """Tests camera and system functions."""
+import io
+import os
+from datetime import datetime
+import tempfile
 import unittest
 from unittest import mock
 import time
@@ -7,6 +11,7 @@ from blinkpy import blinkpy
 from blinkpy.sync_module import BlinkSyncModule
 from blinkpy.camera import BlinkCamera
 from blinkpy.helpers.util import get_time, BlinkURLHandler
+from blinkpy.helpers.constants import DOWNLOAD_MANIFEST, TIMEOUT_MEDIA
 
 
 class MockSyncModule(BlinkSyncModule):
@@ -56,7 +61,7 @@ class TestBlinkFunctions(unittest.TestCase):
         mock_req.return_value = {}
         formatted_date = get_time(blink.last_refresh)
         expected_log = [
-            "INFO:blinkpy.blinkpy:Retrieving videos since {}".format(formatted_date),
+            f"INFO:blinkpy.blinkpy:Retrieving videos since {formatted_date}",
             "DEBUG:blinkpy.blinkpy:Processing page 1",
             "INFO:blinkpy.blinkpy:No videos found on page 1. Exiting.",
         ]
@@ -68,6 +73,7 @@ class TestBlinkFunctions(unittest.TestCase):
     def test_parse_downloaded_items(self, mock_req):
         """Test ability to parse downloaded items list."""
         blink = blinkpy.Blink()
+        blink.urls = BlinkURLHandler("test")
         generic_entry = {
             "created_at": "1970",
             "device_name": "foo",
@@ -79,7 +85,7 @@ class TestBlinkFunctions(unittest.TestCase):
         blink.last_refresh = 0
         formatted_date = get_time(blink.last_refresh)
         expected_log = [
-            "INFO:blinkpy.blinkpy:Retrieving videos since {}".format(formatted_date),
+            f"INFO:blinkpy.blinkpy:Retrieving videos since {formatted_date}",
             "DEBUG:blinkpy.blinkpy:Processing page 1",
             "DEBUG:blinkpy.blinkpy:foo: /bar.mp4 is marked as deleted.",
         ]
@@ -115,6 +121,7 @@ class TestBlinkFunctions(unittest.TestCase):
     def test_parse_camera_not_in_list(self, mock_req):
         """Test ability to parse downloaded items list."""
         blink = blinkpy.Blink()
+        blink.urls = BlinkURLHandler("test")
         generic_entry = {
             "created_at": "1970",
             "device_name": "foo",
@@ -126,7 +133,7 @@ class TestBlinkFunctions(unittest.TestCase):
         blink.last_refresh = 0
         formatted_date = get_time(blink.last_refresh)
         expected_log = [
-            "INFO:blinkpy.blinkpy:Retrieving videos since {}".format(formatted_date),
+            f"INFO:blinkpy.blinkpy:Retrieving videos since {formatted_date}",
             "DEBUG:blinkpy.blinkpy:Processing page 1",
             "DEBUG:blinkpy.blinkpy:Skipping videos for foo.",
         ]
@@ -134,6 +141,152 @@ class TestBlinkFunctions(unittest.TestCase):
             blink.download_videos("/tmp", camera="bar", stop=2, delay=0)
         self.assertListEqual(dl_log.output, expected_log)
 
+    @mock.patch("blinkpy.blinkpy.api.http_get")
+    @mock.patch("blinkpy.blinkpy.api.request_videos")
+    def test_download_videos_to_file(self, mock_req, mock_get):
+        """Test that videos on a page are written to file."""
+        entries = [
+            {
+                "created_at": f"1970-0{index}",
+                "device_name": "foo",
+                "deleted": False,
+                "media": f"/bar{index}.mp4",
+            }
+            for index in range(1, 4)
+        ]
+        mock_req.return_value = {"media": entries}
+        mock_get.side_effect = lambda *args, **kwargs: mock.MagicMock(
+            raw=io.BytesIO(b"video")
+        )
+        self.blink.last_refresh = 0
+        with tempfile.TemporaryDirectory() as path:
+            self.blink.download_videos(path, stop=2, delay=0)
+            files = sorted(name for name in os.listdir(path) if name.endswith(".mp4"))
+            self.assertEqual(
+                files, ["foo-1970-01.mp4", "foo-1970-02.mp4", "foo-1970-03.mp4"]
+            )
+            with open(os.path.join(path, files[0]), "rb") as vidfile:
+                self.assertEqual(vidfile.read(), b"video")
+        self.assertEqual(mock_get.call_count, 3)
+
+    @mock.patch("blinkpy.blinkpy.api.http_get")
+    @mock.patch("blinkpy.blinkpy.api.request_videos")
+    def test_download_videos_manifest(self, mock_req, mock_get):
+        """Test that videos in the manifest are skipped on later calls."""
+        pages = {
+            1: {
+                "media": [
+                    {
+                        "created_at": "1971",
+                        "device_name": "foo",
+                        "deleted": False,
+                        "media": "/new.mp4",
+                    }
+                ]
+            },
+            2: {
+                "media": [
+                    {
+                        "created_at": "1970",
+                        "device_name": "foo",
+                        "deleted": False,
+                        "media": "/old.mp4",
+                    }
+                ]
+            },
+        }
+        mock_req.side_effect = lambda blink, time, page: pages.get(page, {})
+        mock_get.side_effect = lambda *args, **kwargs: mock.MagicMock(
+            raw=io.BytesIO(b"video")
+        )
+        self.blink.last_refresh = 0
+        with tempfile.TemporaryDirectory() as path:
+            self.blink.download_videos(path, stop=2, delay=0)
+            self.assertEqual(mock_get.call_count, 1)
+            self.assertIn(DOWNLOAD_MANIFEST, os.listdir(path))
+
+            mock_req.reset_mock()
+            self.blink.download_videos(path, stop=10, delay=0)
+            self.assertEqual(mock_req.call_count, 3)
+            self.assertEqual(mock_get.call_count, 2)
+            mock_get.assert_called_with(
+                self.blink,
+                url=f"{self.blink.urls.base_url}/old.mp4",
+                stream=True,
+                json=False,
+                timeout=TIMEOUT_MEDIA,
+            )
+            self.assertTrue(os.path.isfile(os.path.join(path, "foo-1970.mp4")))
+
+            mock_req.reset_mock()
+            with mock.patch("os.path.isfile") as mock_isfile:
+                self.blink.download_videos(path, stop=10, delay=0)
+            mock_isfile.assert_not_called()
+            self.assertEqual(mock_req.call_count, 3)
+            self.assertEqual(mock_get.call_count, 2)
+
+            os.remove(os.path.join(path, "foo-1970.mp4"))
+            self.blink.download_videos(path, stop=10, delay=0)
+            self.assertEqual(mock_get.call_count, 2)
+
+    def test_load_manifest_partial_line(self):
+        """Test that a truncated manifest entry is ignored."""
+        with tempfile.TemporaryDirectory() as path:
+            self.blink._manifest_file = os.path.join(path, DOWNLOAD_MANIFEST)
+            with open(self.blink._manifest_file, "w") as manifest:
+                manifest.write('"foo|1970"\n"bar|19')
+            self.assertEqual(self.blink._load_manifest(), {"foo|1970"})
+
+    @mock.patch("blinkpy.blinkpy.api.http_get")
+    @mock.patch("blinkpy.blinkpy.api.request_videos")
+    def test_download_videos_delay_per_worker(self, mock_req, mock_get):
+        """Test that the download delay is applied per worker."""
+        entries = [
+            {
+                "created_at": f"1970-0{index}",
+                "device_name": "foo",
+                "deleted": False,
+                "media": f"/bar{index}.mp4",
+            }
+            for index in range(1, 5)
+        ]
+        mock_req.return_value = {"media": entries}
+        mock_get.side_effect = lambda *args, **kwargs: mock.MagicMock(
+            raw=io.BytesIO(b"video")
+        )
+        self.blink.last_refresh = 0
+        with tempfile.TemporaryDirectory() as path:
+            start = time.time()
+            self.blink.download_videos(path, stop=2, delay=0.2, max_workers=4)
+            delta = time.time() - start
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertTrue(0.2 <= delta < 0.6)
+
+    @mock.patch("blinkpy.blinkpy.api.http_get")
+    def test_download_one_no_response(self, mock_get):
+        """Test that a failed clip request does not create a file."""
+        mock_get.return_value = None
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, "foo.mp4")
+            with self.assertLogs(level="ERROR"):
+                self.assertFalse(
+                    self.blink._download_one("/bar.mp4", filename, "foo|1970")
+                )
+            self.assertFalse(os.path.isfile(filename))
+
+    def test_parse_since(self):
+        """Test parsing of download start times."""
+        expected = datetime(2018, 7, 28, 12, 33)
+        self.assertEqual(blinkpy._parse_since("2018-07-28T12:33:00"), expected)
+        self.assertEqual(blinkpy._parse_since("2018/07/28 12:33:00"), expected)
+        self.assertEqual(
+            blinkpy._parse_since("videos since 2018/07/28 12:33:00"), expected
+        )
+        with mock.patch("dateutil.parser.parse") as mock_parse:
+            blinkpy._parse_since("12:33")
+            blinkpy._parse_since("12:33")
+        self.assertEqual(mock_parse.call_count, 2)
+
     @mock.patch("blinkpy.blinkpy.api.request_network_update")
     @mock.patch("blinkpy.auth.Auth.query")
     def test_refresh(self, mock_req, mock_update):
@@ -146,3 +299,20 @@ class TestBlinkFunctions(unittest.TestCase):
         self.blink.cameras = {"bar": MockCamera(self.blink.sync)}
         self.blink.sync["foo"].cameras = self.blink.cameras
         self.assertTrue(self.blink.refresh())
+
+    @mock.patch("blinkpy.blinkpy.Blink.check_if_ok_to_update", return_value=True)
+    @mock.patch("blinkpy.blinkpy.Blink.get_homescreen")
+    def test_refresh_all_syncs(self, mock_home, mock_ok):
+        """Test that every sync module is refreshed on the refresh pool."""
+        self.blink.available = True
+        self.blink.sync["foo"] = MockSyncModule(self.blink, "foo", 1, [])
+        self.blink.sync["bar"] = MockSyncModule(self.blink, "bar", 2, [])
+        with mock.patch.object(MockSyncModule, "refresh") as mock_refresh:
+            self.assertTrue(self.blink.refresh(force=True))
+            self.assertEqual(mock_refresh.call_count, 2)
+            self.assertEqual(self.blink.refresh_pool._max_workers, 2)
+
+            refresh_pool = self.blink.refresh_pool
+            self.assertTrue(self.blink.refresh(force=True))
+            self.assertIs(self.blink.refresh_pool, refresh_pool)
+            self.assertEqual(mock_refresh.call_count, 4)
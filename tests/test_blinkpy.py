@@ -8,6 +8,7 @@ any communication related errors at startup.
 
 import unittest
 from unittest import mock
+from requests.structures import CaseInsensitiveDict
 from blinkpy.blinkpy import Blink, BlinkSetupError
 from blinkpy.sync_module import BlinkOwl, BlinkLotus
 from blinkpy.helpers.constants import __version__
@@ -75,6 +76,24 @@ class TestBlinkSetup(unittest.TestCase):
         self.assertEqual(self.blink.check_if_ok_to_update(), False)
         self.assertEqual(self.blink.last_refresh, now)
 
+    @mock.patch("blinkpy.blinkpy.time.monotonic")
+    @mock.patch("blinkpy.blinkpy.time.time")
+    def test_throttle_clock_change(self, mock_time, mock_monotonic):
+        """Check that wall clock changes do not affect throttling."""
+        mock_time.return_value = 100000
+        mock_monotonic.return_value = 50
+        with mock.patch(
+            "blinkpy.sync_module.BlinkSyncModule.refresh", return_value=True
+        ), mock.patch("blinkpy.blinkpy.Blink.get_homescreen", return_value=True):
+            self.blink.refresh(force=True)
+
+        mock_time.return_value = 0
+        self.assertFalse(self.blink.check_if_ok_to_update())
+        mock_time.return_value = 200000
+        self.assertFalse(self.blink.check_if_ok_to_update())
+        mock_monotonic.return_value = 50 + self.blink.refresh_rate
+        self.assertTrue(self.blink.check_if_ok_to_update())
+
     def test_sync_case_insensitive_dict(self):
         """Check that we can access sync modules ignoring case."""
         self.blink.sync["test"] = 1234
@@ -195,10 +214,64 @@ class TestBlinkSetup(unittest.TestCase):
         }
         combined = self.blink.merge_cameras()
         self.assertEqual(combined["test"], 123)
+        self.assertEqual(combined["TEST"], 123)
         self.assertEqual(combined["foo"], "bar")
         self.assertEqual(combined["fizz"], "buzz")
         self.assertEqual(combined["bar"], "foo")
 
+    def test_cameras_view(self):
+        """Test that cameras reflect the current sync module cameras."""
+        self.blink.sync["foo"] = MockSync(CaseInsensitiveDict({"Test": 123}))
+        self.blink.sync["bar"] = MockSync(CaseInsensitiveDict({}))
+        self.assertEqual(self.blink.cameras["test"], 123)
+        self.assertNotIn("fizz", self.blink.cameras)
+
+        self.blink.sync["bar"].cameras["Fizz"] = "buzz"
+        self.assertEqual(self.blink.cameras["FIZZ"], "buzz")
+        self.assertEqual(dict(self.blink.cameras), {"Test": 123, "Fizz": "buzz"})
+
+    def test_cameras_assignment(self):
+        """Test that assigned cameras do not modify sync modules."""
+        self.blink.sync["foo"] = MockSync(CaseInsensitiveDict({"test": 123}))
+        self.blink.cameras = {"Bar": "foo"}
+        self.blink.cameras["fizz"] = "buzz"
+        self.assertEqual(self.blink.cameras["bar"], "foo")
+        self.assertEqual(self.blink.cameras["test"], 123)
+        self.assertEqual(self.blink.cameras["fizz"], "buzz")
+        self.assertEqual(dict(self.blink.sync["foo"].cameras), {"test": 123})
+
+    def test_cameras_shadowing(self):
+        """Test that assigned cameras shadow sync cameras ignoring case."""
+        self.blink.sync["foo"] = MockSync(
+            CaseInsensitiveDict({"Front": 123, "Back": 456})
+        )
+        self.blink.cameras["front"] = "bar"
+        self.assertEqual(len(self.blink.cameras), 2)
+        self.assertEqual(
+            sorted(self.blink.cameras.items()), [("Back", 456), ("front", "bar")]
+        )
+        self.assertEqual(self.blink.cameras["FRONT"], "bar")
+
+        del self.blink.cameras["FRONT"]
+        self.assertEqual(self.blink.cameras["front"], 123)
+        del self.blink.cameras["back"]
+        self.assertEqual(dict(self.blink.sync["foo"].cameras), {"Front": 123})
+        with self.assertRaises(KeyError):
+            del self.blink.cameras["back"]
+
+        self.blink.cameras["front"] = "bar"
+        self.assertEqual(self.blink.cameras.pop("FRONT"), "bar")
+        self.assertEqual(self.blink.cameras.pop("Front"), 123)
+        self.assertEqual(self.blink.cameras.pop("front", None), None)
+        with self.assertRaises(KeyError):
+            self.blink.cameras.pop("front")
+        self.assertEqual(len(self.blink.cameras), 0)
+
+        self.blink.sync["foo"].cameras["Side"] = 789
+        self.assertEqual(self.blink.cameras.popitem(), ("Side", 789))
+        with self.assertRaises(KeyError):
+            self.blink.cameras.popitem()
+
     @mock.patch("blinkpy.blinkpy.BlinkOwl.start")
     def test_initialize_blink_minis(self, mock_start):
         """Test blink mini initialization."""
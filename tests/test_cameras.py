@@ -8,6 +8,7 @@ Blink system is set up.
 
 import unittest
 from unittest import mock
+from requests.structures import CaseInsensitiveDict
 from blinkpy.blinkpy import Blink
 from blinkpy.helpers.util import BlinkURLHandler
 from blinkpy.sync_module import BlinkSyncModule
@@ -29,10 +30,15 @@ CAMERA_CFG = {
 class TestBlinkCameraSetup(unittest.TestCase):
     """Test the Blink class in blinkpy."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up Blink module."""
-        self.blink = Blink()
-        self.blink.urls = BlinkURLHandler("test")
+        cls.blink = Blink()
+        cls.blink.urls = BlinkURLHandler("test")
+
+    def setUp(self):
+        """Set up camera."""
+        self.blink.sync = CaseInsensitiveDict({})
         self.blink.sync["test"] = BlinkSyncModule(self.blink, "test", 1234, [])
         self.camera = BlinkCamera(self.blink.sync["test"])
         self.camera.name = "foobar"
@@ -40,7 +46,6 @@ class TestBlinkCameraSetup(unittest.TestCase):
 
     def tearDown(self):
         """Clean up after test."""
-        self.blink = None
         self.camera = None
 
     def test_camera_update(self, mock_resp):
@@ -1,9 +1,15 @@
 """Test various api functions."""
 
+import json
+import os
+import tempfile
+import threading
 import unittest
 from unittest import mock
 import time
+from blinkpy.helpers import util
 from blinkpy.helpers.util import json_load, Throttle, time_to_seconds, gen_uid
+import tests.mock_responses as mresp
 
 
 class TestUtil(unittest.TestCase):
@@ -125,6 +131,7 @@ class TestUtil(unittest.TestCase):
         correct_time = "1970-01-01T00:00:05+00:00"
         wrong_time = "1/1/1970 00:00:03"
         self.assertEqual(time_to_seconds(correct_time), 5)
+        self.assertEqual(time_to_seconds("1970-01-01T00:00:05Z"), 5)
         self.assertFalse(time_to_seconds(wrong_time))
 
     def test_json_load_bad_data(self):
@@ -133,6 +140,49 @@ class TestUtil(unittest.TestCase):
         with mock.patch("builtins.open", mock.mock_open(read_data="")):
             self.assertEqual(json_load("fake.file"), None)
 
+    def test_json_response(self):
+        """Check json decoding with and without orjson."""
+        fake_resp = mresp.MockResponse({"foo": "bar"}, 200)
+        fake_orjson = mock.Mock()
+        fake_orjson.loads.side_effect = json.loads
+        with mock.patch("blinkpy.helpers.util.orjson", fake_orjson):
+            self.assertEqual(util.json_response(fake_resp), {"foo": "bar"})
+        fake_orjson.loads.assert_called_once_with(fake_resp.content)
+        with mock.patch("blinkpy.helpers.util.orjson", None):
+            self.assertEqual(util.json_response(fake_resp), {"foo": "bar"})
+
+    def test_get_url_handler(self):
+        """Check that url handlers are shared per region."""
+        handler = util.get_url_handler("test")
+        self.assertEqual(handler.subdomain, "rest-test")
+        self.assertIs(util.get_url_handler("test"), handler)
+        self.assertIsNot(util.get_url_handler("other"), handler)
+        with self.assertRaises(TypeError):
+            util.get_url_handler(None)
+
+    def test_json_save_concurrent(self):
+        """Check that concurrent saves to one file do not collide."""
+        errors = []
+
+        def save(value):
+            try:
+                util.json_save({"value": value}, file_name)
+            except OSError as error:
+                errors.append(error)
+
+        with tempfile.TemporaryDirectory() as path:
+            file_name = os.path.join(path, "login.json")
+            threads = [
+                threading.Thread(target=save, args=(value,)) for value in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(errors, [])
+            self.assertEqual(os.listdir(path), ["login.json"])
+            self.assertIn(json_load(file_name)["value"], range(8))
+
     def test_gen_uid(self):
         """Test gen_uid formatting."""
         val1 = gen_uid(8)